@@ -1,31 +1,37 @@
 """
 Main entry point for the A2A Reminder Agent.
 """
+import sys
+
+if not __package__:
+    # Running as a plain script: make the project root importable before any
+    # other import is resolved, then load this file as part of its package
+    # (PEP 366) so the relative imports below work.
+    import os
+    sys.path.insert(
+        0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+    )
+    __package__ = 'agents.reminder'
+    import agents.reminder  # noqa: F401
+
+import asyncio
+import atexit
 import logging
+import logging.handlers
 import os
+import queue
 
 import click
+import orjson
 
-# Import approach that works for direct running
-import sys
-import os
+from dotenv import load_dotenv
+
+# Load .env before importing the agent, which reads its settings at import
+load_dotenv()
 
-# Add the parent directory to the Python path
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-# Now we can import regardless of how the script is run
-try:
-    # Try relative imports first (when running as a module)
-    from .agent import ReminderAgent
-    from .task_manager import AgentTaskManager
-    from .scheduler import reminder_scheduler
-except ImportError:
-    # Fallback to direct imports from the current directory
-    from agent import ReminderAgent
-    from task_manager import AgentTaskManager
-    from scheduler import reminder_scheduler
+from .agent import ReminderAgent
+from .task_manager import AgentTaskManager
+from .scheduler import reminder_scheduler
 from common.server import A2AServer
 from common.types import (
     AgentCapabilities,
@@ -34,14 +40,80 @@ from common.types import (
     MissingAPIKeyError,
 )
 from common.utils.push_notification_auth import PushNotificationSenderAuth
-from dotenv import load_dotenv
-
+from starlette.responses import Response
 
-load_dotenv()
 
-logging.basicConfig(level=logging.INFO)
+# basicConfig gives the QueueHandler the BASIC_FORMAT formatter, and
+# QueueHandler formats each record (tracebacks included) on the calling thread.
+# The listener's StreamHandler therefore keeps the default "%(message)s"
+# formatter and only writes that text, moving the blocking stderr write off the
+# event loop. force=True replaces the handler the scheduler module's
+# basicConfig already installed.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.StreamHandler()
+)
+logging.basicConfig(
+    level=logging.INFO,
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+    force=True,
+)
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
+# Serialized /reminders body, keyed on reminder_scheduler.version. "pending"
+# holds the (version, task) of an encode in progress so that concurrent misses
+# share it instead of each snapshotting and serializing the store.
+_reminders_cache = {"version": None, "body": b"", "pending": None}
+
+
+async def _encode_reminders(version):
+    # Snapshot the store off the event loop
+    reminders = await asyncio.get_running_loop().run_in_executor(
+        None, reminder_scheduler.get_all_reminders
+    )
+    formatted_reminders = [
+        {
+            "id": reminder_id,
+            "time": details["time"],
+            "message": details["payload"].get("message", "No message"),
+            "webhook_url": details["webhook_url"]
+        }
+        for reminder_id, details in reminders.items()
+    ]
+    # orjson encodes the reminder datetimes natively as RFC 3339
+    body = orjson.dumps(
+        {
+            "count": len(formatted_reminders),
+            "reminders": formatted_reminders
+        },
+        option=orjson.OPT_NAIVE_UTC,
+    )
+
+    # version was read before the snapshot, so the body is at least that new
+    _reminders_cache["version"] = version
+    _reminders_cache["body"] = body
+    return body
+
+
+async def _get_reminders_body():
+    """Return the encoded reminder list, re-encoding only after it changes."""
+    version = reminder_scheduler.version
+    if _reminders_cache["version"] == version:
+        return _reminders_cache["body"]
+
+    pending = _reminders_cache["pending"]
+    if pending is None or pending[0] != version:
+        pending = (version, asyncio.ensure_future(_encode_reminders(version)))
+        _reminders_cache["pending"] = pending
+    try:
+        # Shielded so one client disconnecting does not cancel the shared task
+        return await asyncio.shield(pending[1])
+    finally:
+        if _reminders_cache["pending"] is pending and pending[1].done():
+            _reminders_cache["pending"] = None
+
 
 @click.command()
 @click.option('--host', 'host', default='localhost')
@@ -54,6 +126,8 @@ def main(host, port):
                 'OPENAI_API_KEY environment variable not set.'
             )
 
+        agent = ReminderAgent()
+
         capabilities = AgentCapabilities(streaming=True, pushNotifications=True)
         skill = AgentSkill(
             id='schedule_reminder',
@@ -71,8 +145,8 @@ def main(host, port):
             description='An agent that lists, retrieves and schedules reminders based on natural language instructions',
             url=f'http://{host}:{port}',
             version='1.0.0',
-            defaultInputModes=ReminderAgent().SUPPORTED_CONTENT_TYPES,
-            defaultOutputModes=ReminderAgent().SUPPORTED_CONTENT_TYPES,
+            defaultInputModes=agent.SUPPORTED_CONTENT_TYPES,
+            defaultOutputModes=agent.SUPPORTED_CONTENT_TYPES,
             capabilities=capabilities,
             skills=[skill],
         )
@@ -83,48 +157,29 @@ def main(host, port):
         server = A2AServer(
             agent_card=agent_card,
             task_manager=AgentTaskManager(
-                agent=ReminderAgent(),
+                agent=agent,
                 notification_sender_auth=notification_sender_auth,
             ),
             host=host,
             port=port,
         )
 
-        server.app.add_route(
-            '/.well-known/jwks.json',
-            notification_sender_auth.handle_jwks_endpoint,
-            methods=['GET'],
-        )
-        
-        # Agent.json endpoint for A2A discovery
-        from starlette.responses import JSONResponse
-        server.app.add_route(
-            "/.well-known/agent.json",
-            lambda request: JSONResponse(
-                content=agent_card.model_dump()
-            ),
-            methods=["GET"],
-        )
+        # The key set is fixed once generated, so serialize it only once
+        jwks_json = orjson.dumps({'keys': notification_sender_auth.public_keys})
+
+        # async so Starlette serves the constant on the loop, not the threadpool
+        async def get_jwks(request):
+            return Response(jwks_json, media_type='application/json')
+
+        server.app.add_route('/.well-known/jwks.json', get_jwks, methods=['GET'])
         
         # Add an endpoint to list all reminders
         # Note: reminder_scheduler is already imported at the top of the file
         @server.app.route("/reminders", methods=["GET"])
         async def list_reminders(request):
-            reminders = reminder_scheduler.get_all_reminders()
-            formatted_reminders = []
-            
-            for reminder_id, details in reminders.items():
-                formatted_reminders.append({
-                    "id": reminder_id,
-                    "time": str(details["time"]),
-                    "message": details["payload"].get("message", "No message"),
-                    "webhook_url": details["webhook_url"]
-                })
-                
-            return JSONResponse({
-                "count": len(formatted_reminders),
-                "reminders": formatted_reminders
-            })
+            return Response(
+                await _get_reminders_body(), media_type="application/json"
+            )
         
         logger.info(f'Starting Reminder Agent server on {host}:{port}')
         server.start()
@@ -3,40 +3,38 @@ Reminder agent built with LangGraph that interprets natural language
 and schedules reminders using the scheduler module.
 """
 import os
+import asyncio
+import atexit
+import contextlib
 import datetime
-import json
+import functools
+import queue
+import re
+import string
+import threading
+import time
 import uuid
 from collections.abc import AsyncIterable
+from concurrent.futures import Future
 from typing import Any, Dict, List, Literal, Annotated, Optional
 
-# Import MCP client for datetime
-import mcp
-import pytz  # For timezone handling in fallback mode
-
-from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+# LangGraph, the OpenAI client, httpx and mcp are imported where they are
+# first used so that importing this module stays cheap
+from langchain_core.messages import BaseMessage, AIMessage
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field, validator
 
-from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
-
-# Import the scheduler implementation
-import sys
-import os as _os  # Import with alias to avoid conflicts
+from .scheduler import reminder_scheduler
 
-# Fix imports when run as a script
-try:
-    # Try relative imports first (when running as a module)
-    from .scheduler import reminder_scheduler
-except ImportError:
-    # Fallback to direct imports from the current directory
-    from scheduler import reminder_scheduler
+# Read once; every LLM client in the process is built from this key
+_OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY")
 
-# Create memory saver for LangGraph checkpointing
-memory = MemorySaver()
+_mcp_client_lock = threading.Lock()
+# Process-wide MCP datetime client; only a successful connection is kept, so
+# a failed spawn is retried on the next call
+_mcp_client = None
 
-def get_mcp_datetime_client():
+def _connect_mcp_datetime_client():
     try:
         # Create an MCP client instance
         from mcp import ClientSession, StdioServerParameters
@@ -49,6 +47,21 @@ def get_mcp_datetime_client():
         print(f"Error connecting to MCP datetime server: {e}")
         return None
 
+def get_mcp_datetime_client():
+    """Return the process-wide MCP datetime client, spawning it on first use."""
+    global _mcp_client
+    with _mcp_client_lock:
+        if _mcp_client is None:
+            _mcp_client = _connect_mcp_datetime_client()
+        return _mcp_client
+
+@atexit.register
+def _close_mcp_datetime_client():
+    # Only tear down a client that was actually started
+    client = _mcp_client
+    if client is not None and hasattr(client, "close"):
+        client.close()
+
 # Schema definition for reminder
 class ReminderSchema(BaseModel):
     webhook_url: str = Field(..., description="URL to trigger when the reminder is due")
@@ -61,6 +74,102 @@ class ReminderSchema(BaseModel):
         # Always generate a new UUID if None is provided
         return v or str(uuid.uuid4())
 
+def _parse_reminder_time(time: str) -> datetime.datetime:
+    """Parse an ISO timestamp, assuming the local timezone when none is given.
+
+    Falls back to one hour from now if the value cannot be parsed.
+    """
+    try:
+        # Parse the time with timezone awareness
+        reminder_time = datetime.datetime.fromisoformat(time)
+        if reminder_time.tzinfo is None:
+            # Treat it as local time; astimezone() applies the offset in force
+            # at that moment, so it stays correct across DST changes
+            reminder_time = reminder_time.astimezone()
+    except ValueError:
+        # If parsing fails, use current time + 1 hour as fallback
+        reminder_time = datetime.datetime.now().astimezone() + datetime.timedelta(hours=1)
+    return reminder_time
+
+class _BatchScheduler:
+    """Coalesces reminders scheduled close together into one scheduler call.
+
+    Callers block on the returned future while a background thread drains
+    everything that arrives within ``window`` seconds of the first pending
+    reminder and hands it to ``reminder_scheduler.schedule_many``.
+    """
+
+    def __init__(self, window: float = 0.05, max_batch: int = 64):
+        self._window = window
+        self._max_batch = max_batch
+        self._pending = queue.SimpleQueue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+
+    def schedule(self, **reminder) -> Future:
+        """Queue a reminder; the future resolves to its scheduled ID."""
+        future = Future()
+        self._pending.put((reminder, future))
+        if self._worker is None:
+            with self._worker_lock:
+                if self._worker is None:
+                    self._worker = threading.Thread(
+                        target=self._run, name="reminder-batcher", daemon=True
+                    )
+                    self._worker.start()
+        return future
+
+    def _run(self):
+        while True:
+            batch = [self._pending.get()]
+            deadline = time.monotonic() + self._window
+            while len(batch) < self._max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self._pending.get(timeout=timeout))
+                except queue.Empty:
+                    break
+            self._flush(batch)
+
+    def _flush(self, batch):
+        try:
+            reminder_ids = reminder_scheduler.schedule_many(
+                [reminder for reminder, _ in batch]
+            )
+        except Exception:
+            # The batch was rolled back; schedule one by one so each caller
+            # gets its own result or error
+            for reminder, future in batch:
+                try:
+                    future.set_result(reminder_scheduler.schedule_reminder(**reminder))
+                except Exception as e:
+                    future.set_exception(e)
+            return
+        for (_, future), reminder_id in zip(batch, reminder_ids):
+            future.set_result(reminder_id)
+
+_batch_scheduler = _BatchScheduler()
+
+def _schedule_reminder_impl(
+    webhook_url: str,
+    reminder_time: datetime.datetime,
+    message: str,
+    reminder_id: str,
+) -> str:
+    """Schedule an already validated reminder and describe the result."""
+    payload = {"message": message, "scheduled_at": reminder_time.isoformat()}
+    
+    scheduled_id = _batch_scheduler.schedule(
+        reminder_time=reminder_time,
+        webhook_url=webhook_url,
+        payload=payload,
+        reminder_id=reminder_id
+    ).result()
+    
+    return f"Reminder scheduled with ID: {scheduled_id}"
+
 # Tool definitions for the reminder agent
 @tool
 def schedule_reminder(
@@ -79,28 +188,12 @@ def schedule_reminder(
         reminder_id=reminder_id
     )
     
-    try:
-        # Parse the time with timezone awareness
-        reminder_time = datetime.datetime.fromisoformat(reminder_data.time)
-        if reminder_time.tzinfo is None:
-            # Add current timezone if not specified
-            current_tz = datetime.datetime.now().astimezone().tzinfo
-            reminder_time = reminder_time.replace(tzinfo=current_tz)
-    except ValueError:
-        # If parsing fails, use current time + 1 hour as fallback
-        reminder_time = datetime.datetime.now().astimezone() + datetime.timedelta(hours=1)
-        reminder_data.time = reminder_time.isoformat()
-        
-    payload = {"message": reminder_data.message, "scheduled_at": reminder_data.time}
-    
-    scheduled_id = reminder_scheduler.schedule_reminder(
-        reminder_time=reminder_time,
+    return _schedule_reminder_impl(
         webhook_url=reminder_data.webhook_url,
-        payload=payload,
+        reminder_time=_parse_reminder_time(reminder_data.time),
+        message=reminder_data.message,
         reminder_id=reminder_data.reminder_id
     )
-    
-    return f"Reminder scheduled with ID: {scheduled_id}"
 
 @tool
 def get_current_datetime(format: Annotated[str, "Format for the datetime output (standard, iso, filename, japanese)"] = "iso") -> str:
@@ -139,29 +232,32 @@ def get_current_datetime(format: Annotated[str, "Format for the datetime output
         else:  # standard format
             return now.strftime("%B %d, %Y, %I:%M:%S %p")
 
+# Formatted list_reminders output, keyed by the scheduler version it reflects
+_list_reminders_cache = (None, "")
+
 @tool
 def list_reminders() -> str:
     """List all currently scheduled reminders."""
+    global _list_reminders_cache
+    version = reminder_scheduler.version
+    if _list_reminders_cache[0] == version:
+        return _list_reminders_cache[1]
+
     reminders = reminder_scheduler.get_all_reminders()
     
     if not reminders:
-        return "You don't have any reminders scheduled."
-    
-    # Format the reminders in a readable way
-    result = ["Here are your currently scheduled reminders:"]
-    
-    for reminder_id, details in reminders.items():
-        scheduled_time = details["time"]
-        # Convert to user's local time for display
-        local_time = scheduled_time.astimezone()
-        formatted_time = local_time.strftime('%Y-%m-%d %H:%M:%S %Z')
-        
-        message = details["payload"].get("message", "No message specified")
-        result.append(f"\n- ID: {reminder_id}")
-        result.append(f"  Time: {formatted_time}")
-        result.append(f"  Message: {message}")
+        text = "You don't have any reminders scheduled."
+    else:
+        # Format the reminders in a readable way, converting to local time
+        text = "\n".join(["Here are your currently scheduled reminders:"] + [
+            f"\n- ID: {reminder_id}"
+            f"\n  Time: {details['time'].astimezone().strftime('%Y-%m-%d %H:%M:%S %Z')}"
+            f"\n  Message: {details['payload'].get('message', 'No message specified')}"
+            for reminder_id, details in reminders.items()
+        ])
     
-    return "\n".join(result)
+    _list_reminders_cache = (version, text)
+    return text
 
 # Response format class for structured agent responses
 class ResponseFormat(BaseModel):
@@ -176,18 +272,34 @@ class AgentState(BaseModel):
     next: str = Field(default="")
     reminder_details: Dict[str, Any] = Field(default_factory=dict)
 
-# Parser node to extract reminder details from natural language
-def parser(state: AgentState) -> AgentState:
-    """Parse the natural language input to extract reminder details."""
-    messages = state.messages.copy()
-    
-    # Get current datetime using the tool instead of hardcoded value
-    current_time = get_current_datetime(format="iso")
-    
-    # Add system message to instruct the LLM
-    system_message = {
-        "role": "system", 
-        "content": """You are a reminder parsing assistant. 
+def _close_http_clients(http_client, http_async_client):
+    http_client.close()
+    if not http_async_client.is_closed:
+        # The serving loop is gone by now, so close on a throwaway one
+        with contextlib.suppress(RuntimeError):
+            asyncio.run(http_async_client.aclose())
+
+@functools.lru_cache(maxsize=1)
+def _get_llm():
+    """Return the shared chat model used by every node and the react agent."""
+    import httpx
+    from langchain_openai import ChatOpenAI
+
+    # Keep-alive pool shared by all OpenAI requests
+    limits = httpx.Limits(max_keepalive_connections=32, max_connections=64)
+    http_client = httpx.Client(http2=True, timeout=30, limits=limits)
+    http_async_client = httpx.AsyncClient(http2=True, timeout=30, limits=limits)
+    atexit.register(_close_http_clients, http_client, http_async_client)
+
+    return ChatOpenAI(
+        model="gpt-3.5-turbo",
+        temperature=0,
+        openai_api_key=_OPENAI_API_KEY,
+        http_client=http_client,
+        http_async_client=http_async_client,
+    )
+
+_PARSER_SYSTEM_TEMPLATE = string.Template("""You are a reminder parsing assistant. 
         Extract the time and reminder details from the user's message.
         Use the schedule_reminder function to set up the reminder.
         
@@ -206,60 +318,65 @@ def parser(state: AgentState) -> AgentState:
         Set response status to input_required if you need more information from the user.
         Set response status to error if there is an error processing the request.
         Set response status to completed if the reminder was successfully scheduled.
-        """.replace("${current_time}", current_time)
+        """)
+
+# Parser node to extract reminder details from natural language
+def parser(state: AgentState) -> AgentState:
+    """Parse the natural language input to extract reminder details."""
+    # Get current datetime using the tool instead of hardcoded value
+    current_time = get_current_datetime(format="iso")
+    
+    # Add system message to instruct the LLM
+    system_message = {
+        "role": "system", 
+        "content": _PARSER_SYSTEM_TEMPLATE.substitute(current_time=current_time)
     }
     
-    # Initialize OpenAI client with API key
-    api_key = os.getenv("OPENAI_API_KEY")
-    llm = ChatOpenAI(
-        model="gpt-3.5-turbo", 
-        temperature=0,
-        openai_api_key=api_key
-    )
+    llm = _get_llm()
     
     # Call the LLM to extract details
     response = llm.invoke(
-        messages + [system_message],
+        [*state.messages, system_message],
         tools=[schedule_reminder],
         tool_choice={"type": "function", "function": {"name": "schedule_reminder"}}
     )
     
     # Extract the function call details
-    if hasattr(response, "additional_kwargs") and "tool_calls" in response.additional_kwargs:
-        tool_calls = response.additional_kwargs["tool_calls"]
-        if tool_calls and len(tool_calls) > 0:
-            function_call = tool_calls[0]["function"]
-            reminder_args = json.loads(function_call["arguments"])
-            
-            # Generate a UUID if not present
-            if "reminder_id" not in reminder_args or not reminder_args["reminder_id"]:
-                reminder_args["reminder_id"] = str(uuid.uuid4())
-            
-            # Ensure schema validation is still happening
-            try:
-                # Validate against schema
-                reminder_details = ReminderSchema(**reminder_args).dict()
-                state.reminder_details = reminder_details
-                state.next = "scheduler"
-            except Exception as e:
-                print(f"Schema validation error: {e}")
-                # If validation fails, still ensure we have the data
-                state.reminder_details = reminder_args
-                state.next = "scheduler"
+    # LangChain has already parsed the arguments into response.tool_calls
+    tool_calls = getattr(response, "tool_calls", None)
+    if tool_calls:
+        reminder_args = dict(tool_calls[0]["args"])
+        
+        # Generate a UUID if not present
+        if "reminder_id" not in reminder_args or not reminder_args["reminder_id"]:
+            reminder_args["reminder_id"] = str(uuid.uuid4())
+        
+        # Ensure schema validation is still happening
+        try:
+            # Validate against schema
+            reminder_details = ReminderSchema(**reminder_args).dict()
+            state.reminder_details = reminder_details
+            state.next = "scheduler"
+        except Exception as e:
+            print(f"Schema validation error: {e}")
+            # If validation fails, still ensure we have the data
+            state.reminder_details = reminder_args
+            state.next = "scheduler"
     else:
         state.next = "clarification"
-        messages.append(
+        state.messages.append(
             AIMessage(content="I couldn't determine when to set the reminder. Please provide a clearer time.")
         )
     
-    state.messages = messages + [response]
+    state.messages.append(response)
     return state
 
 # Scheduler node to create the reminder
 def scheduler(state: AgentState) -> AgentState:
     """Use the scheduler to create the reminder."""
+    from langgraph.graph import END
+
     details = state.reminder_details
-    messages = state.messages.copy()
     
     # Default webhook URL if not specified
     if "webhook_url" not in details or not details["webhook_url"]:
@@ -269,16 +386,15 @@ def scheduler(state: AgentState) -> AgentState:
     if "reminder_id" not in details or not details["reminder_id"]:
         details["reminder_id"] = str(uuid.uuid4())
     
-    # Schedule the reminder using the tool
-    result = schedule_reminder(
+    # The parser already validated these details, so skip the tool's schema check
+    result = _schedule_reminder_impl(
         webhook_url=details["webhook_url"],
-        time=details["time"],
+        reminder_time=_parse_reminder_time(details["time"]),
         message=details["message"],
         reminder_id=details["reminder_id"]
     )
     
-    messages.append(AIMessage(content=result))
-    state.messages = messages
+    state.messages.append(AIMessage(content=result))
     state.next = END
     
     return state
@@ -286,24 +402,18 @@ def scheduler(state: AgentState) -> AgentState:
 # Clarification node to ask for more details
 def clarification(state: AgentState) -> AgentState:
     """Ask for clarification on unclear inputs."""
-    messages = state.messages.copy()
-    
-    # Initialize OpenAI client with API key
-    api_key = os.getenv("OPENAI_API_KEY")
-    llm = ChatOpenAI(
-        model="gpt-3.5-turbo", 
-        temperature=0,
-        openai_api_key=api_key
-    )
+    from langchain_core.messages import HumanMessage
+
+    llm = _get_llm()
     
     response = llm.invoke(
-        messages + [
+        [
+            *state.messages,
             HumanMessage(content="Could you please provide a clearer time for when you want the reminder?")
         ]
     )
     
-    messages.append(response)
-    state.messages = messages
+    state.messages.append(response)
     state.next = "parser"
     
     return state
@@ -327,6 +437,12 @@ class ReminderAgent:
         'Set response status to completed if the reminder was successfully scheduled or listed.'
     )
 
+    # Phrases suggesting the agent is asking the user for more detail
+    _CLARIFY_RE = re.compile(
+        r"clearer|more specific|when|time|provide more|could you clarify",
+        re.IGNORECASE,
+    )
+
     def __init__(self):
         """Initialize the reminder agent with the LangGraph components."""
         # Create the graph
@@ -337,21 +453,17 @@ class ReminderAgent:
 
     def _create_reminder_graph(self):
         """Create the LangGraph for the reminder agent using LangGraph 0.4.3 compatibility."""
+        from langgraph.checkpoint.memory import MemorySaver
         from langgraph.prebuilt import create_react_agent
         
         # Initialize LLM
-        api_key = os.getenv("OPENAI_API_KEY")
-        llm = ChatOpenAI(
-            model="gpt-3.5-turbo", 
-            temperature=0,
-            openai_api_key=api_key
-        )
+        llm = _get_llm()
         
         # Use create_react_agent which is available in LangGraph 0.4.3
         react_agent = create_react_agent(
             model=llm,
             tools=[schedule_reminder, list_reminders, get_current_datetime],
-            checkpointer=memory,
+            checkpointer=MemorySaver(),
             prompt=self.SYSTEM_INSTRUCTION
         )
         
@@ -363,6 +475,12 @@ class ReminderAgent:
         result = self.graph.invoke({"messages": [{"role": "user", "content": query}]}, config)
         return self._process_agent_response(result)
 
+    async def ainvoke(self, query, sessionId) -> dict:
+        """Process a reminder request without blocking the event loop."""
+        config = {'configurable': {'thread_id': sessionId}}
+        result = await self.graph.ainvoke({"messages": [{"role": "user", "content": query}]}, config)
+        return self._process_agent_response(result)
+
     async def stream(self, query, sessionId) -> AsyncIterable[dict[str, Any]]:
         """Stream the agent's response for a reminder request."""
         config = {'configurable': {'thread_id': sessionId}}
@@ -374,9 +492,19 @@ class ReminderAgent:
             'content': 'Processing your reminder request...',
         }
         
-        # For agents with streaming, we'd implement real streaming here
-        # But for now we'll just invoke normally and yield the final result
-        result = self.graph.invoke({"messages": [{"role": "user", "content": query}]}, config)
+        # Stream graph states so tool calls are reported while the LLM works
+        inputs = {"messages": [{"role": "user", "content": query}]}
+        result = None
+        async for state in self.graph.astream(inputs, config, stream_mode="values"):
+            result = state
+            message = state["messages"][-1]
+            if isinstance(message, AIMessage) and message.tool_calls:
+                tool_names = ", ".join(call["name"] for call in message.tool_calls)
+                yield {
+                    'is_task_complete': False,
+                    'require_user_input': False,
+                    'content': f'Running {tool_names}...',
+                }
         
         # Process the result and yield the response
         yield self._process_agent_response(result)
@@ -416,7 +544,7 @@ class ReminderAgent:
                 'require_user_input': False,
                 'content': content,
             }
-        elif any(phrase in content.lower() for phrase in ["clearer", "more specific", "when", "time", "provide more", "could you clarify"]):
+        elif self._CLARIFY_RE.search(content):
             return {
                 'is_task_complete': False,
                 'require_user_input': True,
@@ -16,14 +16,18 @@ def list_all_reminders():
         print("No reminders are currently scheduled.")
         return
     
-    print("\n----- Currently Scheduled Reminders -----")
-    for reminder_id, details in reminders.items():
-        print(f"\nReminder ID: {reminder_id}")
-        print(f"Time: {details['time']}")
-        message = details['payload'].get('message', 'No message specified')
-        print(f"Message: {message}")
-        print(f"Webhook URL: {details['webhook_url']}")
-        print("-" * 40)
+    # Build the whole listing first and write it in one go
+    separator = "-" * 40
+    lines = ["\n----- Currently Scheduled Reminders -----"]
+    lines += [
+        f"\nReminder ID: {reminder_id}"
+        f"\nTime: {details['time']}"
+        f"\nMessage: {details['payload'].get('message', 'No message specified')}"
+        f"\nWebhook URL: {details['webhook_url']}"
+        f"\n{separator}"
+        for reminder_id, details in reminders.items()
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     list_all_reminders()
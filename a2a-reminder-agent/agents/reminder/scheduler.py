@@ -2,8 +2,13 @@
 Scheduler module using APScheduler to handle webhook triggers.
 """
 import datetime
+import itertools
 import logging
+import threading
+from dataclasses import dataclass
+from typing import Any
 import requests
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_MISSED
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.date import DateTrigger
 
@@ -11,25 +16,42 @@ from apscheduler.triggers.date import DateTrigger
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on tracked reminders before scheduling is refused
+MAX_REMINDERS = 10_000
+
+class SchedulerFullError(Exception):
+    """Raised when scheduling would exceed the scheduler's reminder limit."""
+
+@dataclass(slots=True)
+class ReminderRow:
+    """Tracking entry for a single scheduled reminder."""
+    time: datetime.datetime
+    webhook_url: str
+    payload: dict
+    job: Any
+
 class ReminderScheduler:
     """
     A scheduler for managing and triggering reminders via webhooks.
     """
-    def __init__(self):
+    def __init__(self, max_reminders=MAX_REMINDERS):
         self.scheduler = BackgroundScheduler()
+        # Jobs that are skipped as missed never call _trigger_webhook, so
+        # their tracking rows are dropped here instead
+        self.scheduler.add_listener(
+            self._on_job_finished, EVENT_JOB_MISSED | EVENT_JOB_ERROR
+        )
         self.scheduler.start()
-        self.jobs = {}  # Dictionary to store job information
+        self.jobs = {}  # Reminder ID -> ReminderRow
+        self.max_reminders = max_reminders
+        # Source of default IDs; unlike len(self.jobs) it never repeats an ID
+        # after reminders are removed
+        self._id_counter = itertools.count(1)
+        self.version = 0  # Bumped whenever the set of reminders changes
+        self._lock = threading.Lock()  # Guards jobs and version
         self.logger = logging.getLogger(__name__)
         self.logger.info("Scheduler initialized and started")
     
-    def get_all_reminders(self):
-        """Get all scheduled reminders.
-        
-        Returns:
-            dict: Dictionary of all reminder details, keyed by reminder ID
-        """
-        return self.jobs.copy()
-    
     def schedule_reminder(self, reminder_time, webhook_url, payload, reminder_id=None):
         """
         Schedule a reminder to trigger a webhook at the specified time.
@@ -42,9 +64,58 @@ class ReminderScheduler:
             
         Returns:
             str: The ID of the scheduled reminder
+            
+        Raises:
+            SchedulerFullError: If max_reminders reminders are already scheduled
         """
+        with self._lock:
+            reminder_id = self._add_reminder(
+                reminder_time, webhook_url, payload, reminder_id
+            )
+            self.version += 1
+        
+        logger.info(f"Scheduled reminder {reminder_id} for {reminder_time}")
+        return reminder_id
+    
+    def schedule_many(self, reminders):
+        """
+        Schedule several reminders under a single lock acquisition.
+        
+        The batch is all-or-nothing: if any reminder fails to schedule, the
+        ones already added from this batch are removed again.
+        
+        Args:
+            reminders (list[dict]): Keyword arguments for schedule_reminder,
+                one dict per reminder
+            
+        Returns:
+            list[str]: The IDs of the scheduled reminders, in input order
+        """
+        reminder_ids = []
+        with self._lock:
+            try:
+                for reminder in reminders:
+                    reminder_ids.append(self._add_reminder(**reminder))
+            except Exception:
+                for reminder_id in reminder_ids:
+                    self.scheduler.remove_job(reminder_id)
+                    del self.jobs[reminder_id]
+                raise
+            self.version += 1
+        
+        logger.info(f"Scheduled {len(reminder_ids)} reminders: {reminder_ids}")
+        return reminder_ids
+    
+    def _add_reminder(self, reminder_time, webhook_url, payload, reminder_id=None):
+        """Add the job and its tracking entry. The caller must hold the lock."""
+        if len(self.jobs) >= self.max_reminders:
+            self._prune_stale_rows()
+        if len(self.jobs) >= self.max_reminders:
+            raise SchedulerFullError(
+                f"Cannot schedule more than {self.max_reminders} reminders"
+            )
         if reminder_id is None:
-            reminder_id = f"reminder_{len(self.jobs) + 1}"
+            reminder_id = f"reminder_{next(self._id_counter)}"
             
         # Create job to trigger webhook
         job = self.scheduler.add_job(
@@ -54,14 +125,12 @@ class ReminderScheduler:
             id=reminder_id
         )
         
-        self.jobs[reminder_id] = {
-            "job": job,
-            "time": reminder_time,
-            "webhook_url": webhook_url,
-            "payload": payload
-        }
-        
-        logger.info(f"Scheduled reminder {reminder_id} for {reminder_time}")
+        self.jobs[reminder_id] = ReminderRow(
+            time=reminder_time,
+            webhook_url=webhook_url,
+            payload=payload,
+            job=job
+        )
         return reminder_id
     
     def _trigger_webhook(self, webhook_url, payload, reminder_id):
@@ -76,11 +145,36 @@ class ReminderScheduler:
         try:
             response = requests.post(webhook_url, json=payload)
             logger.info(f"Triggered reminder {reminder_id} - Status: {response.status_code}")
-            # Remove job from tracking dict after it's executed
-            if reminder_id in self.jobs:
-                del self.jobs[reminder_id]
         except Exception as e:
             logger.error(f"Failed to trigger reminder {reminder_id}: {str(e)}")
+        finally:
+            # The job has run either way, so stop tracking it; a failed
+            # webhook must not hold a slot against max_reminders forever
+            self._discard_row(reminder_id)
+    
+    def _on_job_finished(self, event):
+        """Drop the tracking row of a job that was missed or errored."""
+        self._discard_row(event.job_id)
+    
+    def _discard_row(self, reminder_id):
+        with self._lock:
+            if self.jobs.pop(reminder_id, None) is not None:
+                self.version += 1
+    
+    def _prune_stale_rows(self):
+        """
+        Drop rows whose job is no longer in the scheduler. The caller must
+        hold the lock.
+        """
+        stale = [
+            reminder_id for reminder_id in self.jobs
+            if self.scheduler.get_job(reminder_id) is None
+        ]
+        for reminder_id in stale:
+            del self.jobs[reminder_id]
+        if stale:
+            self.version += 1
+            logger.warning(f"Pruned {len(stale)} finished reminders: {stale}")
     
     def cancel_reminder(self, reminder_id):
         """
@@ -92,9 +186,13 @@ class ReminderScheduler:
         Returns:
             bool: Whether the reminder was successfully canceled
         """
-        if reminder_id in self.jobs:
-            self.scheduler.remove_job(reminder_id)
-            del self.jobs[reminder_id]
+        with self._lock:
+            canceled = reminder_id in self.jobs
+            if canceled:
+                self.scheduler.remove_job(reminder_id)
+                del self.jobs[reminder_id]
+                self.version += 1
+        if canceled:
             logger.info(f"Canceled reminder {reminder_id}")
             return True
         logger.warning(f"Could not cancel reminder {reminder_id}: not found")
@@ -107,13 +205,14 @@ class ReminderScheduler:
         Returns:
             dict: Dictionary of all scheduled reminders
         """
-        return {
-            reminder_id: {
-                "time": job_info["time"],
-                "webhook_url": job_info["webhook_url"],
-                "payload": job_info["payload"]
-            } for reminder_id, job_info in self.jobs.items()
-        }
+        with self._lock:
+            return {
+                reminder_id: {
+                    "time": row.time,
+                    "webhook_url": row.webhook_url,
+                    "payload": row.payload
+                } for reminder_id, row in self.jobs.items()
+            }
 
 # Create a global instance of the scheduler
 reminder_scheduler = ReminderScheduler()
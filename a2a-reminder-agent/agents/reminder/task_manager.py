@@ -3,29 +3,10 @@ Task manager for the reminder agent using the A2A protocol.
 """
 import asyncio
 import logging
-import traceback
 
 from collections.abc import AsyncIterable
 
-import sys
-import os
-
-# Add parent directory to Python path if not already there
-parent_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
-
-# Try different import approaches
-try:
-    # Try relative import first
-    from .agent import ReminderAgent
-except ImportError:
-    try:
-        # Try direct import
-        from agent import ReminderAgent
-    except ImportError:
-        # Last resort: try absolute import with updated path
-        from agents.reminder.agent import ReminderAgent
+from .agent import ReminderAgent
 from common.server import utils
 from common.server.task_manager import InMemoryTaskManager
 from common.types import (
@@ -53,70 +34,84 @@ from common.utils.push_notification_auth import PushNotificationSenderAuth
 
 logger = logging.getLogger(__name__)
 
+# Default cap on streaming agent runs executing at the same time
+MAX_CONCURRENT_STREAMS = 64
+# Upper bound in seconds on a single streaming agent run
+STREAM_TIMEOUT = 300
+# Fixed fields of the single artifact a completed streaming task produces
+_ARTIFACT_TEMPLATE = {'index': 0, 'append': False}
+
 
 class AgentTaskManager(InMemoryTaskManager):
     def __init__(
         self,
         agent: ReminderAgent,
         notification_sender_auth: PushNotificationSenderAuth,
+        max_concurrent_streams: int = MAX_CONCURRENT_STREAMS,
     ):
         super().__init__()
         self.agent = agent
         self.notification_sender_auth = notification_sender_auth
+        # Admission control for streaming runs; _max can be changed at
+        # runtime through set_max_concurrent_streams
+        self._admit = asyncio.Condition()
+        self._active = 0
+        self._max = max_concurrent_streams
+
+    async def set_max_concurrent_streams(self, max_concurrent_streams: int):
+        """Resizes the streaming concurrency limit, waking waiters if raised."""
+        if max_concurrent_streams < 1:
+            raise ValueError('max_concurrent_streams must be at least 1')
+        async with self._admit:
+            self._max = max_concurrent_streams
+            self._admit.notify_all()
 
     async def _run_streaming_agent(self, request: SendTaskStreamingRequest):
+        """Runs a streaming task once a concurrency slot is available."""
+        async with self._admit:
+            await self._admit.wait_for(lambda: self._active < self._max)
+            self._active += 1
+        try:
+            await self._stream_agent_response(request)
+        finally:
+            async with self._admit:
+                self._active -= 1
+                self._admit.notify(1)
+
+    async def _stream_agent_response(self, request: SendTaskStreamingRequest):
         task_send_params: TaskSendParams = request.params
         query = self._get_user_query(task_send_params)
 
         # Ensure the task exists in the store before updating it
         await self.upsert_task(task_send_params)
 
-        try:
-            async for item in self.agent.stream(
-                query, task_send_params.sessionId
-            ):
-                is_task_complete = item['is_task_complete']
-                require_user_input = item['require_user_input']
-                artifact = None
-                message = None
-                parts = [{'type': 'text', 'text': item['content']}]
-                end_stream = False
-
-                if not is_task_complete and not require_user_input:
-                    task_state = TaskState.WORKING
-                    message = Message(role='agent', parts=parts)
-                elif require_user_input:
-                    task_state = TaskState.INPUT_REQUIRED
-                    message = Message(role='agent', parts=parts)
-                    end_stream = True
-                else:
-                    task_state = TaskState.COMPLETED
-                    artifact = Artifact(parts=parts, index=0, append=False)
-                    end_stream = True
-
-                task_status = TaskStatus(state=task_state, message=message)
-                latest_task = await self.update_store(
-                    task_send_params.id,
-                    task_status,
-                    None if artifact is None else [artifact],
-                )
-                await self.send_task_notification(latest_task)
-
-                if artifact:
-                    task_artifact_update_event = TaskArtifactUpdateEvent(
-                        id=task_send_params.id, artifact=artifact
-                    )
-                    await self.enqueue_events_for_sse(
-                        task_send_params.id, task_artifact_update_event
-                    )
-
-                task_update_event = TaskStatusUpdateEvent(
-                    id=task_send_params.id, status=task_status, final=end_stream
-                )
-                await self.enqueue_events_for_sse(
-                    task_send_params.id, task_update_event
-                )
+        # Push config is fixed for the life of the stream, so look it up once
+        push_info = None
+        if await self.has_push_notification_info(task_send_params.id):
+            push_info = await self.get_push_notification_info(
+                task_send_params.id
+            )
 
+        try:
+            # Chunks are emitted one at a time so SSE events keep the agent's
+            # order; the timeout bounds the whole run
+            async with asyncio.timeout(STREAM_TIMEOUT):
+                async for item in self.agent.stream(
+                    query, task_send_params.sessionId
+                ):
+                    await self._emit_event(item, task_send_params, push_info)
+
+        except TimeoutError:
+            logger.error(
+                f'Streaming task {task_send_params.id} timed out after '
+                f'{STREAM_TIMEOUT}s'
+            )
+            await self.enqueue_events_for_sse(
+                task_send_params.id,
+                InternalError(
+                    message='The agent did not finish within the time limit'
+                ),
+            )
         except Exception as e:
             logger.error(f'An error occurred while streaming the response: {e}')
             await self.enqueue_events_for_sse(
@@ -126,6 +121,63 @@ class AgentTaskManager(InMemoryTaskManager):
                 ),
             )
 
+    async def _emit_event(
+        self,
+        item: dict,
+        task_send_params: TaskSendParams,
+        push_info: PushNotificationConfig | None,
+    ):
+        """Stores one streamed agent chunk and fans it out to listeners."""
+        is_task_complete = item['is_task_complete']
+        require_user_input = item['require_user_input']
+        artifact = None
+        message = None
+        # Everything below is built from trusted agent output, so the models
+        # are constructed directly instead of being re-validated per chunk
+        parts = [TextPart.model_construct(text=item['content'])]
+        end_stream = False
+
+        if not is_task_complete and not require_user_input:
+            task_state = TaskState.WORKING
+            message = Message.model_construct(role='agent', parts=parts)
+        elif require_user_input:
+            task_state = TaskState.INPUT_REQUIRED
+            message = Message.model_construct(role='agent', parts=parts)
+            end_stream = True
+        else:
+            task_state = TaskState.COMPLETED
+            artifact = Artifact.model_construct(
+                parts=parts, **_ARTIFACT_TEMPLATE
+            )
+            end_stream = True
+
+        task_status = TaskStatus.model_construct(
+            state=task_state, message=message
+        )
+        latest_task = await self.update_store(
+            task_send_params.id,
+            task_status,
+            None if artifact is None else [artifact],
+        )
+        task_update_event = TaskStatusUpdateEvent.model_construct(
+            id=task_send_params.id, status=task_status, final=end_stream
+        )
+        if artifact:
+            task_artifact_update_event = TaskArtifactUpdateEvent.model_construct(
+                id=task_send_params.id, artifact=artifact
+            )
+            events = [task_artifact_update_event, task_update_event]
+        else:
+            events = [task_update_event]
+
+        # The store is already updated, so the push notification and the SSE
+        # fan-out are independent and can run concurrently
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(self._notify(latest_task, push_info))
+            tg.create_task(
+                self.enqueue_events_for_sse_batch(task_send_params.id, events)
+            )
+
     def _validate_request(
         self, request: SendTaskRequest | SendTaskStreamingRequest
     ) -> JSONRPCResponse | None:
@@ -178,7 +230,9 @@ class AgentTaskManager(InMemoryTaskManager):
             await self.update_store(task_id, task_status)
 
             query = self._get_user_query(task_send_params)
-            agent_response = self.agent.invoke(query, task_send_params.sessionId)
+            agent_response = await self.agent.ainvoke(
+                query, task_send_params.sessionId
+            )
             
             return await self._process_agent_response(request, agent_response)
         except Exception as e:
@@ -226,9 +280,8 @@ class AgentTaskManager(InMemoryTaskManager):
             return self.dequeue_events_for_sse(
                 request.id, task_send_params.id, sse_event_queue
             )
-        except Exception as e:
-            logger.error(f'Error in SSE stream: {e}')
-            print(traceback.format_exc())
+        except Exception:
+            logger.exception('Error in SSE stream')
             return JSONRPCResponse(
                 id=request.id,
                 error=InternalError(
@@ -273,10 +326,18 @@ class AgentTaskManager(InMemoryTaskManager):
             logger.info(f'No push notification info found for task {task.id}')
             return
         push_info = await self.get_push_notification_info(task.id)
+        await self._notify(task, push_info)
+
+    async def _notify(
+        self, task: Task, push_info: PushNotificationConfig | None
+    ):
+        """Sends a push notification for an already-resolved push config."""
+        if push_info is None:
+            return
 
         logger.info(f'Notifying for task {task.id} => {task.status.state}')
         await self.notification_sender_auth.send_push_notification(
-            push_info.url, data=task.model_dump(exclude_none=True)
+            push_info.url, data=task.model_dump(mode="json", exclude_none=True)
         )
 
     async def on_resubscribe_to_task(
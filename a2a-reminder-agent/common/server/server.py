@@ -1,14 +1,16 @@
+import asyncio
 import json
 import logging
 
-from collections.abc import AsyncIterable
+from collections.abc import AsyncIterable, AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any
 
 from pydantic import ValidationError
 from sse_starlette.sse import EventSourceResponse
 from starlette.applications import Starlette
 from starlette.requests import Request
-from starlette.responses import JSONResponse
+from starlette.responses import Response
 
 from common.server.task_manager import TaskManager
 from common.types import (
@@ -45,7 +47,9 @@ class A2AServer:
         self.endpoint = endpoint
         self.task_manager = task_manager
         self.agent_card = agent_card
-        self.app = Starlette()
+        # Encoded card, filled on the first discovery request
+        self._agent_card_json: bytes | None = None
+        self.app = Starlette(lifespan=self._use_eager_tasks)
         self.app.add_route(
             self.endpoint, self._process_request, methods=['POST']
         )
@@ -64,8 +68,36 @@ class A2AServer:
 
         uvicorn.run(self.app, host=self.host, port=self.port)
 
-    def _get_agent_card(self, request: Request) -> JSONResponse:
-        return JSONResponse(self.agent_card.model_dump(exclude_none=True))
+    @staticmethod
+    @asynccontextmanager
+    async def _use_eager_tasks(app: Starlette) -> AsyncIterator[None]:
+        """Start new tasks eagerly on the serving loop (Python 3.12+).
+
+        Coroutines that finish without suspending then skip a trip through
+        the event loop.
+        """
+        if hasattr(asyncio, 'eager_task_factory'):
+            asyncio.get_running_loop().set_task_factory(
+                asyncio.eager_task_factory
+            )
+        yield
+
+    @staticmethod
+    def _json_response(model, status_code: int = 200) -> Response:
+        """Serialize a model straight to JSON bytes in pydantic-core."""
+        return Response(
+            model.model_dump_json(exclude_none=True),
+            status_code=status_code,
+            media_type='application/json',
+        )
+
+    async def _get_agent_card(self, request: Request) -> Response:
+        # The card is fixed once serving starts, so encode it only once
+        if self._agent_card_json is None:
+            self._agent_card_json = self.agent_card.model_dump_json(
+                exclude_none=True
+            ).encode()
+        return Response(self._agent_card_json, media_type='application/json')
 
     async def _process_request(self, request: Request):
         try:
@@ -107,7 +139,7 @@ class A2AServer:
         except Exception as e:
             return self._handle_exception(e)
 
-    def _handle_exception(self, e: Exception) -> JSONResponse:
+    def _handle_exception(self, e: Exception) -> Response:
         if isinstance(e, json.decoder.JSONDecodeError):
             json_rpc_error = JSONParseError()
         elif isinstance(e, ValidationError):
@@ -117,13 +149,11 @@ class A2AServer:
             json_rpc_error = InternalError()
 
         response = JSONRPCResponse(id=None, error=json_rpc_error)
-        return JSONResponse(
-            response.model_dump(exclude_none=True), status_code=400
-        )
+        return self._json_response(response, status_code=400)
 
     def _create_response(
         self, result: Any
-    ) -> JSONResponse | EventSourceResponse:
+    ) -> Response | EventSourceResponse:
         if isinstance(result, AsyncIterable):
 
             async def event_generator(result) -> AsyncIterable[dict[str, str]]:
@@ -132,6 +162,6 @@ class A2AServer:
 
             return EventSourceResponse(event_generator(result))
         if isinstance(result, JSONRPCResponse):
-            return JSONResponse(result.model_dump(exclude_none=True))
+            return self._json_response(result)
         logger.error(f'Unexpected result type: {type(result)}')
         raise ValueError(f'Unexpected result type: {type(result)}')
@@ -280,19 +280,34 @@ class InMemoryTaskManager(TaskManager):
             for subscriber in current_subscribers:
                 await subscriber.put(task_update_event)
 
+    async def enqueue_events_for_sse_batch(self, task_id, events: list):
+        """Enqueues several events as one queue item per subscriber."""
+        async with self.subscriber_lock:
+            if task_id not in self.task_sse_subscribers:
+                return
+
+            current_subscribers = self.task_sse_subscribers[task_id]
+            for subscriber in current_subscribers:
+                await subscriber.put(events)
+
     async def dequeue_events_for_sse(
         self, request_id, task_id, sse_event_queue: asyncio.Queue
     ) -> AsyncIterable[SendTaskStreamingResponse] | JSONRPCResponse:
         try:
             while True:
-                event = await sse_event_queue.get()
-                if isinstance(event, JSONRPCError):
-                    yield SendTaskStreamingResponse(id=request_id, error=event)
-                    break
-
-                yield SendTaskStreamingResponse(id=request_id, result=event)
-                if isinstance(event, TaskStatusUpdateEvent) and event.final:
-                    break
+                item = await sse_event_queue.get()
+                # Batched enqueues arrive as a list of events
+                events = item if isinstance(item, list) else (item,)
+                for event in events:
+                    if isinstance(event, JSONRPCError):
+                        yield SendTaskStreamingResponse(
+                            id=request_id, error=event
+                        )
+                        return
+
+                    yield SendTaskStreamingResponse(id=request_id, result=event)
+                    if isinstance(event, TaskStatusUpdateEvent) and event.final:
+                        return
         finally:
             async with self.subscriber_lock:
                 if task_id in self.task_sse_subscribers:
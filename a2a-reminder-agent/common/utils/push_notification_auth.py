@@ -8,6 +8,7 @@ from typing import Any
 
 import httpx
 import jwt
+import orjson
 
 from jwcrypto import jwk
 from jwt import PyJWK, PyJWKClient
@@ -95,10 +96,19 @@ class PushNotificationSenderAuth(PushNotificationAuth):
 
     async def send_push_notification(self, url: str, data: dict[str, Any]):
         jwt_token = self._generate_jwt(data)
-        headers = {'Authorization': f'Bearer {jwt_token}'}
+        headers = {
+            'Authorization': f'Bearer {jwt_token}',
+            'Content-Type': 'application/json',
+        }
+        # The signed hash is computed over the canonical stdlib encoding, which
+        # the receiver recomputes from the parsed body, so only the wire bytes
+        # come from orjson.
+        body = orjson.dumps(data)
         async with httpx.AsyncClient(timeout=10) as client:
             try:
-                response = await client.post(url, json=data, headers=headers)
+                response = await client.post(
+                    url, content=body, headers=headers
+                )
                 response.raise_for_status()
                 logger.info(f'Push-notification sent for URL: {url}')
             except Exception as e:
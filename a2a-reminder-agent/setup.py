@@ -14,9 +14,12 @@ setup(
         "requests>=2.31.0",
         "fastapi>=0.103.2",
         "uvicorn>=0.23.2",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
+        "httptools>=0.6.0",
         "starlette>=0.27.0",
         "pydantic>=2.7.4",
-        "httpx>=0.27.0",
+        "httpx[http2]>=0.27.0",
+        "orjson>=3.9.0",
         "click>=8.1.8",
         "cryptography>=42.0.0",
         "httpx-sse>=0.4.0",
@@ -26,7 +29,6 @@ setup(
         "typing-extensions>=4.12.2",
         "mcp>=1.1.1",
         "mcp-datetime>=0.1.4",
-        "pytz>=2024.1",
     ],
-    python_requires=">=3.10,<3.13",
+    python_requires=">=3.11,<3.13",
 )
@@ -2,12 +2,12 @@
 Simple client for testing the A2A Reminder Agent.
 """
 import asyncio
-import json
 import logging
 import uuid
 from datetime import datetime
 
 import httpx
+import orjson
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -15,10 +15,8 @@ logger = logging.getLogger(__name__)
 # Agent URL
 AGENT_URL = "http://localhost:10000/a2a"
 
-async def send_reminder_request(message: str):
+async def send_reminder_request(client: httpx.AsyncClient, message: str):
     """Send a reminder request to the A2A agent."""
-    client = httpx.AsyncClient()
-    
     # Create the A2A request JSON
     task_id = str(uuid.uuid4())
     session_id = str(uuid.uuid4())
@@ -45,33 +43,38 @@ async def send_reminder_request(message: str):
         }
     }
     
-    try:
-        logger.info(f"Sending request: {message}")
-        response = await client.post(
-            AGENT_URL,
-            json=request_data,
-            headers={"Content-Type": "application/json"},
-            timeout=60
-        )
-        
-        # Process the response events
-        if response.status_code == 200:
-            text_response = response.text
-            events = text_response.strip().split("\n\n")
-            
-            for event in events:
-                if event.startswith("data:"):
-                    try:
-                        data = json.loads(event[5:])
-                        process_event(data)
-                    except json.JSONDecodeError:
-                        logger.error(f"Failed to parse event: {event}")
-        else:
+    logger.info(f"Sending request: {message}")
+    async with client.stream(
+        "POST",
+        AGENT_URL,
+        content=orjson.dumps(request_data),
+        headers={"Content-Type": "application/json"},
+    ) as response:
+        if response.status_code != 200:
+            await response.aread()
             logger.error(f"Request failed with status code: {response.status_code}")
             logger.error(response.text)
-    
-    finally:
-        await client.aclose()
+            return
+        
+        # Process the SSE events as they arrive, splitting lines out of a
+        # rolling byte buffer and dispatching on each blank line
+        buf = bytearray()
+        data_lines = []
+        async for chunk in response.aiter_bytes():
+            buf += chunk
+            while (idx := buf.find(b"\n")) >= 0:
+                line = bytes(buf[:idx]).rstrip(b"\r")
+                del buf[:idx + 1]
+                if line.startswith(b"data:"):
+                    data_lines.append(line[5:])
+                elif not line and data_lines:
+                    event = b"\n".join(data_lines)
+                    data_lines.clear()
+                    try:
+                        process_event(orjson.loads(event))
+                    except orjson.JSONDecodeError:
+                        logger.error(f"Failed to parse event: {event!r}")
+                # Anything else is a comment/keep-alive or an unused field
 
 def process_event(event):
     """Process an event from the A2A agent."""
@@ -100,13 +103,20 @@ async def main():
     print("==== A2A Reminder Agent Test Client ====")
     print("Enter your reminder request (or 'exit' to quit):")
     
-    while True:
-        user_input = input("> ")
-        if user_input.lower() == "exit":
-            break
-        
-        await send_reminder_request(user_input)
-        print("\nEnter another reminder request or 'exit' to quit:")
+    # One pooled client for the whole session
+    async with httpx.AsyncClient(http2=True, timeout=60) as client:
+        while True:
+            user_input = input("> ")
+            if user_input.lower() == "exit":
+                break
+            
+            await send_reminder_request(client, user_input)
+            print("\nEnter another reminder request or 'exit' to quit:")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -4,12 +4,11 @@ and schedules reminders using the scheduler module.
 """
 import os
 import datetime
-import json
 from typing import Dict, Any, List, Annotated
 from dotenv import load_dotenv
 
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage, SystemMessage
 from langchain_core.tools import tool
 from langgraph.graph import StateGraph, END
 from langgraph.prebuilt import ToolNode
@@ -64,50 +63,41 @@ def schedule_reminder(
 
 # The schedule_reminder function is already converted to a tool using the @tool decorator
 
-# Parser node to extract reminder details from natural language
-def parser(state: AgentState) -> AgentState:
-    """Parse the natural language input to extract reminder details."""
-    messages = state.messages.copy()
-    
-    # Add system message to instruct the LLM
-    system_message = {
-        "role": "system", 
-        "content": """You are a reminder parsing assistant. 
+# Parser prompt and tool binding are invariant, so build them once at import
+_SYSTEM_MESSAGE = SystemMessage(content="""You are a reminder parsing assistant. 
         Extract the time and reminder details from the user's message.
         Use the schedule_reminder function to set up the reminder.
         Infer the exact date and time from the user's message, accounting for relative times like 'tomorrow', 'next week', etc.
-        """
-    }
-    
+        """)
+_TOOL_CHOICE = {"type": "function", "function": {"name": "schedule_reminder"}}
+_LLM_WITH_TOOL = llm.bind_tools([schedule_reminder], tool_choice=_TOOL_CHOICE)
+
+# Parser node to extract reminder details from natural language
+async def parser(state: AgentState) -> AgentState:
+    """Parse the natural language input to extract reminder details."""
     # Call the LLM to extract details
-    response = llm.invoke(
-        messages + [system_message],
-        tools=[schedule_reminder],
-        tool_choice={"type": "function", "function": {"name": "schedule_reminder"}}
-    )
+    response = await _LLM_WITH_TOOL.ainvoke([*state.messages, _SYSTEM_MESSAGE])
     
     # Extract the function call details
-    if hasattr(response, "additional_kwargs") and "tool_calls" in response.additional_kwargs:
-        tool_calls = response.additional_kwargs["tool_calls"]
-        if tool_calls and len(tool_calls) > 0:
-            function_call = tool_calls[0]["function"]
-            reminder_details = json.loads(function_call["arguments"])
-            state.reminder_details = reminder_details
-            state.next = "scheduler"
+    # LangChain has already parsed the arguments into response.tool_calls
+    tool_calls = getattr(response, "tool_calls", None)
+    if tool_calls:
+        reminder_details = dict(tool_calls[0]["args"])
+        state.reminder_details = reminder_details
+        state.next = "scheduler"
     else:
         state.next = "clarification"
-        messages.append(
+        state.messages.append(
             AIMessage(content="I couldn't determine when to set the reminder. Please provide a clearer time.")
         )
     
-    state.messages = messages + [response]
+    # Nodes append to the state's history in place rather than copying it
+    state.messages.append(response)
     return state
 
 # Scheduler node to create the reminder
-def scheduler(state: AgentState) -> AgentState:
+async def scheduler(state: AgentState) -> AgentState:
     """Use the scheduler to create the reminder."""
-    messages = state.messages.copy()
-    
     # Default webhook URL if not provided
     if "webhook_url" not in state.reminder_details:
         state.reminder_details["webhook_url"] = "http://localhost:8000/webhook"
@@ -115,25 +105,22 @@ def scheduler(state: AgentState) -> AgentState:
     # Schedule the reminder
     result = schedule_reminder(**state.reminder_details)
     
-    messages.append(AIMessage(content=f"✅ {result}"))
-    state.messages = messages
+    state.messages.append(AIMessage(content=f"✅ {result}"))
     state.next = END
     
     return state
 
 # Clarification node to ask for more details
-def clarification(state: AgentState) -> AgentState:
+async def clarification(state: AgentState) -> AgentState:
     """Ask for clarification on unclear inputs."""
-    messages = state.messages.copy()
-    
-    response = llm.invoke(
-        messages + [
+    response = await llm.ainvoke(
+        [
+            *state.messages,
             HumanMessage(content="Could you please provide a clearer time for when you want the reminder?")
         ]
     )
     
-    messages.append(response)
-    state.messages = messages
+    state.messages.append(response)
     state.next = "parser"
     
     return state
@@ -163,8 +150,8 @@ def create_reminder_graph():
 # Create the compiled graph
 reminder_graph = create_reminder_graph()
 
-def process_reminder(message: str):
+async def process_reminder(message: str):
     """Process a reminder message through the graph."""
     state = AgentState(messages=[HumanMessage(content=message)])
-    result = reminder_graph.invoke(state)
+    result = await reminder_graph.ainvoke(state)
     return result
@@ -2,24 +2,70 @@
 Scheduler module using APScheduler to handle webhook triggers.
 """
 import datetime
+import itertools
 import logging
-import requests
-from apscheduler.schedulers.background import BackgroundScheduler
+from dataclasses import dataclass
+from typing import Any
+import httpx
+from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_MISSED
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.date import DateTrigger
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Upper bound on tracked reminders before scheduling is refused
+MAX_REMINDERS = 10_000
+
+class SchedulerFullError(Exception):
+    """Raised when scheduling would exceed the scheduler's reminder limit."""
+
+@dataclass(slots=True)
+class ReminderRow:
+    """Tracking entry for a single scheduled reminder."""
+    time: datetime.datetime
+    webhook_url: str
+    payload: dict
+    job: Any
+
 class ReminderScheduler:
     """
     A scheduler for managing and triggering reminders via webhooks.
     """
-    def __init__(self):
-        self.scheduler = BackgroundScheduler()
+    def __init__(self, max_reminders=MAX_REMINDERS):
+        # Jobs added before start() are kept pending and fire once it runs
+        self.scheduler = AsyncIOScheduler()
+        # Jobs that are skipped as missed never call _trigger_webhook, so
+        # their tracking rows are dropped here instead
+        self.scheduler.add_listener(
+            self._on_job_finished, EVENT_JOB_MISSED | EVENT_JOB_ERROR
+        )
+        self.jobs = {}  # Reminder ID -> ReminderRow
+        self.max_reminders = max_reminders
+        # Source of default IDs; unlike len(self.jobs) it never repeats an ID
+        # after reminders are removed
+        self._id_counter = itertools.count(1)
+        self._client = None  # Shared async HTTP client, created by start()
+        logger.info("Scheduler initialized")
+    
+    def start(self):
+        """
+        Start firing reminders on the running event loop.
+        
+        Must be called from within that loop, normally the server's startup
+        hook, so the scheduler binds to it.
+        """
+        self._client = httpx.AsyncClient(timeout=30, http2=True)
         self.scheduler.start()
-        self.jobs = {}
-        logger.info("Scheduler initialized and started")
+        logger.info("Scheduler started")
+    
+    async def shutdown(self):
+        """Stop the scheduler and close the shared HTTP client."""
+        self.scheduler.shutdown(wait=False)
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.aclose()
     
     def schedule_reminder(self, reminder_time, webhook_url, payload, reminder_id=None):
         """
@@ -33,9 +79,18 @@ class ReminderScheduler:
             
         Returns:
             str: The ID of the scheduled reminder
+            
+        Raises:
+            SchedulerFullError: If max_reminders reminders are already scheduled
         """
+        if len(self.jobs) >= self.max_reminders:
+            self._prune_stale_rows()
+        if len(self.jobs) >= self.max_reminders:
+            raise SchedulerFullError(
+                f"Cannot schedule more than {self.max_reminders} reminders"
+            )
         if reminder_id is None:
-            reminder_id = f"reminder_{len(self.jobs) + 1}"
+            reminder_id = f"reminder_{next(self._id_counter)}"
             
         # Create job to trigger webhook
         job = self.scheduler.add_job(
@@ -45,17 +100,17 @@ class ReminderScheduler:
             id=reminder_id
         )
         
-        self.jobs[reminder_id] = {
-            "job": job,
-            "time": reminder_time,
-            "webhook_url": webhook_url,
-            "payload": payload
-        }
+        self.jobs[reminder_id] = ReminderRow(
+            time=reminder_time,
+            webhook_url=webhook_url,
+            payload=payload,
+            job=job
+        )
         
         logger.info(f"Scheduled reminder {reminder_id} for {reminder_time}")
         return reminder_id
     
-    def _trigger_webhook(self, webhook_url, payload, reminder_id):
+    async def _trigger_webhook(self, webhook_url, payload, reminder_id):
         """
         Trigger the webhook for a scheduled reminder.
         
@@ -65,13 +120,29 @@ class ReminderScheduler:
             reminder_id (str): ID of the reminder
         """
         try:
-            response = requests.post(webhook_url, json=payload)
+            response = await self._client.post(webhook_url, json=payload)
             logger.info(f"Triggered reminder {reminder_id} - Status: {response.status_code}")
-            # Remove job from tracking dict after it's executed
-            if reminder_id in self.jobs:
-                del self.jobs[reminder_id]
         except Exception as e:
             logger.error(f"Failed to trigger reminder {reminder_id}: {str(e)}")
+        finally:
+            # The job has run either way, so stop tracking it; a failed
+            # webhook must not hold a slot against max_reminders forever
+            self.jobs.pop(reminder_id, None)
+    
+    def _on_job_finished(self, event):
+        """Drop the tracking row of a job that was missed or errored."""
+        self.jobs.pop(event.job_id, None)
+    
+    def _prune_stale_rows(self):
+        """Drop rows whose job is no longer in the scheduler."""
+        stale = [
+            reminder_id for reminder_id in self.jobs
+            if self.scheduler.get_job(reminder_id) is None
+        ]
+        for reminder_id in stale:
+            del self.jobs[reminder_id]
+        if stale:
+            logger.warning(f"Pruned {len(stale)} finished reminders: {stale}")
     
     def cancel_reminder(self, reminder_id):
         """
@@ -100,10 +171,10 @@ class ReminderScheduler:
         """
         return {
             reminder_id: {
-                "time": job_info["time"],
-                "webhook_url": job_info["webhook_url"],
-                "payload": job_info["payload"]
-            } for reminder_id, job_info in self.jobs.items()
+                "time": row.time,
+                "webhook_url": row.webhook_url,
+                "payload": row.payload
+            } for reminder_id, row in self.jobs.items()
         }
 
 # Create a global instance of the scheduler
@@ -2,6 +2,7 @@
 FastAPI server for the reminder agent.
 """
 import os
+from contextlib import asynccontextmanager
 from typing import Dict, Any
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -9,10 +10,17 @@ from pydantic import BaseModel
 import uvicorn
 
 from agent import process_reminder
-from scheduler import reminder_scheduler
+from scheduler import SchedulerFullError, reminder_scheduler
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the reminder scheduler on the server's event loop."""
+    reminder_scheduler.start()
+    yield
+    await reminder_scheduler.shutdown()
 
 # Initialize FastAPI app
-app = FastAPI(title="Reminder Agent API")
+app = FastAPI(title="Reminder Agent API", lifespan=lifespan)
 
 # Enable CORS
 app.add_middleware(
@@ -45,10 +53,12 @@ async def create_reminder(request: ReminderRequest):
     """
     try:
         # Process the reminder message
-        result = process_reminder(request.message)
+        result = await process_reminder(request.message)
         # Extract the final message
         final_message = result.messages[-1].content
         return {"status": "success", "message": final_message}
+    except SchedulerFullError as e:
+        raise HTTPException(status_code=503, detail=str(e))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error creating reminder: {str(e)}")
 
@@ -78,4 +88,5 @@ async def handle_webhook(data: WebhookRequest):
     return {"status": "success", "message": "Webhook received"}
 
 if __name__ == "__main__":
+    # uvicorn's default loop="auto" picks uvloop when it is installed
     uvicorn.run("server:app", host="0.0.0.0", port=8000, reload=True)
@@ -1,6 +1,7 @@
 """
 Test script for the reminder agent.
 """
+import asyncio
 import os
 import datetime
 from dotenv import load_dotenv
@@ -23,7 +24,7 @@ def test_reminder_agent():
     
     try:
         # Process the reminder message
-        result = process_reminder(message)
+        result = asyncio.run(process_reminder(message))
         
         # Print the final message
         print("\nAgent response:")
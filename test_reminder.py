@@ -1,51 +1,80 @@
 """
 Simple test script for the reminder agent to verify functionality.
 """
+import asyncio
 import os
+import sys
+import types
 from dotenv import load_dotenv
-from agent import process_reminder
+
+def _load_env_once():
+    """Load .env at most once per process, including child processes."""
+    if os.environ.get("_DOTENV_LOADED"):
+        return
+    load_dotenv(override=False)
+    os.environ["_DOTENV_LOADED"] = "1"
 
 # Ensure environment variables are loaded
-load_dotenv()
+_load_env_once()
+
+# Settings read once after .env is loaded; read-only for the rest of the run
+CONFIG = types.MappingProxyType({
+    "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY"),
+})
+
+# Output separators and the per-reminder block, built once
+_SEP50 = "-" * 50
+_SEP30 = "-" * 30
+_REMINDER_TMPL = (
+    "ID: {id}\nTime: {time}\nMessage: {msg}\nWebhook URL: {url}\n" + _SEP30 + "\n"
+)
 
 def main():
     # Check if OPENAI_API_KEY is set
-    api_key = os.getenv("OPENAI_API_KEY")
+    api_key = CONFIG["OPENAI_API_KEY"]
     if not api_key or api_key == "your_openai_api_key":
         print("⚠️ Please set your OPENAI_API_KEY in the .env file")
         return
     
+    # Import the agent stack only once we know it can actually run
+    from agent import process_reminder
+    from scheduler import reminder_scheduler
+    
     # Sample reminder message
     reminder_message = "Remind me to call John tomorrow at 3pm"
     
     print(f"Processing reminder: '{reminder_message}'")
-    print("-" * 50)
+    print(_SEP50)
     
     # Process the reminder
     try:
-        result = process_reminder(reminder_message)
+        result = asyncio.run(process_reminder(reminder_message))
         
         # Print messages from the result
-        print("\nConversation:")
-        for msg in result.messages:
-            role = msg.type
-            content = msg.content
-            print(f"{role.capitalize()}: {content}")
-            
+        out = ["\nConversation:\n"]
+        out.extend(
+            f"{msg.type.capitalize()}: {msg.content}\n" for msg in result.messages
+        )
+        
         # Print scheduled reminders
-        print("\nScheduled Reminders:")
-        from scheduler import reminder_scheduler
+        out.append("\nScheduled Reminders:\n")
         reminders = reminder_scheduler.get_all_reminders()
         
         if not reminders:
-            print("No reminders were scheduled.")
+            out.append("No reminders were scheduled.\n")
         else:
-            for reminder_id, details in reminders.items():
-                print(f"ID: {reminder_id}")
-                print(f"Time: {details['time']}")
-                print(f"Message: {details['payload']['message']}")
-                print(f"Webhook URL: {details['webhook_url']}")
-                print("-" * 30)
+            out.extend(
+                _REMINDER_TMPL.format_map({
+                    "id": reminder_id,
+                    "time": details["time"],
+                    "msg": details["payload"]["message"],
+                    "url": details["webhook_url"],
+                })
+                for reminder_id, details in reminders.items()
+            )
+        
+        # One write for the whole report instead of a print per line
+        sys.stdout.write("".join(out))
                 
     except Exception as e:
         print(f"Error running the reminder agent: {str(e)}")
@@ -6,8 +6,10 @@ This ensures the agent module can be found by temporarily adding the parent dire
 import os
 import sys
 
-# Add the parent directory to the Python path
-sys.path.insert(0, os.path.abspath("."))
+# Add this script's directory to the Python path, once and independent of cwd
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+if _ROOT not in sys.path:
+    sys.path.insert(0, _ROOT)
 
 # Import and run the reminder agent
 from a2a_reminder_agent.agents.reminder.__main__ import main